@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import partnerai_intel_report as report  # noqa: E402
+
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_OUTPUT_DIR = REPO_ROOT / "benchmarks" / "results"
+
+SOURCES = [
+    "Inter-American Development Bank",
+    "World Bank",
+    "Asian Development Bank",
+    "ReliefWeb",
+    "DevelopmentAid",
+    "UNDP",
+    "IFAD",
+    "UN News Humanitarian",
+]
+COUNTRIES = ["Bolivia", "Bangladesh", "Myanmar", "Kenya", "Sudan", "Ukraine", "Peru", "Nepal"]
+SECTORS = [
+    "Agribusiness",
+    "Ranching and livestock",
+    "Fisheries and aquaculture",
+    "Climate and environment",
+    "Health",
+    "Water and sanitation",
+]
+OPPORTUNITY_TYPES = ["Grants", "Tenders", "Subsidies", "Development programs"]
+HEADLINES = [
+    "{country} {sector} grant program opens call for proposals",
+    "Tender: procurement of {sector} services in {country}",
+    "Flash appeal: emergency response for displacement in {country}",
+    "New policy framework adopted for {sector} in {country}",
+    "Pilot initiative launched to support {sector} partnerships across the region",
+    "Podcast: what the latest {sector} strategy means for {country}",
+]
+BODY_PHRASES = [
+    "Funding is available for smallholder farmers and rural cooperatives.",
+    "Bidders must submit an expression of interest before the deadline.",
+    "The humanitarian situation remains critical with rising food insecurity.",
+    "The program will run nationwide with regional implementation partners.",
+    "Applicants should review the eligibility guidance published with the RFP.",
+    "This blog post summarizes recent discussions at the annual forum.",
+    "The financing will support climate resilience, water and energy access.",
+]
+MONEY_STRINGS = ["$500,000", "$2.5 million", "USD 1,200,000", "EUR 3 million", "$10,000,000", "GBP 750,000"]
+PLACEHOLDER_HOSTS = ["example.org", "example.com", "www.example.com"]
+
+
+def generate_payload(count: int, seed: int, now_utc: datetime) -> dict[str, Any]:
+    """Zapier-shaped payload mixing duplicate URLs, stale items, placeholder hosts and money strings."""
+    rng = random.Random(seed)
+    records: list[dict[str, Any]] = []
+    issued_urls: list[str] = []
+
+    for index in range(count):
+        country = rng.choice(COUNTRIES)
+        sector = rng.choice(SECTORS)
+        title = rng.choice(HEADLINES).format(country=country, sector=sector.lower())
+        description = " ".join(rng.sample(BODY_PHRASES, rng.randint(1, 3)))
+        if rng.random() < 0.4:
+            description += f" Total envelope: {rng.choice(MONEY_STRINGS)}."
+
+        # Roughly a quarter of the items fall outside the default reporting window.
+        if rng.random() < 0.25:
+            published = now_utc - timedelta(days=rng.randint(report.DEFAULT_WINDOW_DAYS + 1, 365))
+        else:
+            published = now_utc - timedelta(minutes=rng.randint(0, report.DEFAULT_WINDOW_DAYS * 24 * 60 - 1))
+
+        roll = rng.random()
+        if roll < 0.1 and issued_urls:
+            url = rng.choice(issued_urls)
+        elif roll < 0.2:
+            url = f"https://{rng.choice(PLACEHOLDER_HOSTS)}/opportunities/{index}"
+        elif roll < 0.25:
+            url = ""
+        else:
+            url = f"https://{rng.choice(['www', 'projects', 'news'])}.partner{rng.randint(1, 60)}.org/items/{index}"
+            issued_urls.append(url)
+
+        record: dict[str, Any] = {
+            "title": title,
+            "country": country,
+            "sector": sector if rng.random() < 0.5 else "",
+            "opportunity_type": rng.choice(OPPORTUNITY_TYPES),
+            "description": description,
+            "source": rng.choice(SOURCES),
+            "url": url,
+        }
+        timestamp_style = rng.random()
+        if timestamp_style < 0.5:
+            record["published_date"] = published.replace(tzinfo=None).isoformat(timespec="seconds")
+        elif timestamp_style < 0.8:
+            record["pubDate"] = published.strftime("%a, %d %b %Y %H:%M:%S +0000")
+        else:
+            record["isoDate"] = published.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        if rng.random() < 0.3:
+            record["amount"] = rng.choice(MONEY_STRINGS)
+        if rng.random() < 0.2:
+            record["content"] = " ".join(rng.choice(BODY_PHRASES) for _ in range(rng.randint(3, 12)))
+        records.append(record)
+
+    return {"opportunities": records}
+
+
+def peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def reset_timestamp_state() -> None:
+    report.timestamp_cache.clear()
+    for tier in report.timestamp_tier_counts:
+        report.timestamp_tier_counts[tier] = 0
+
+
+def run_size(size: int, seed: int) -> dict[str, Any]:
+    now_utc = datetime.now(timezone.utc)
+    payload_text = json.dumps(generate_payload(size, seed, now_utc))
+    stages: dict[str, dict[str, float]] = {}
+
+    @contextmanager
+    def stage(name: str, item_count: int) -> Iterator[None]:
+        started = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - started
+        stages[name] = {
+            "items": item_count,
+            "seconds": round(seconds, 6),
+            "items_per_second": round(item_count / seconds, 1) if seconds else None,
+        }
+
+    with stage("extract_items", size):
+        raw_items = report.extract_items(json.loads(payload_text))
+
+    text_fields = [value for item in raw_items for value in item.values() if isinstance(value, str)]
+    with stage("normalize_text", len(text_fields)):
+        for value in text_fields:
+            report.normalize_text(value)
+
+    reset_timestamp_state()
+    with stage("parse_timestamp", len(raw_items)):
+        timestamps = [report.parse_timestamp(report.resolve_timestamp_value(item)) for item in raw_items]
+
+    window_start = now_utc - timedelta(days=report.DEFAULT_WINDOW_DAYS)
+    fresh = [(item, ts) for item, ts in zip(raw_items, timestamps) if ts and ts >= window_start]
+
+    with stage("coerce_item", len(fresh)):
+        coerced = [(report.coerce_item(item), ts) for item, ts in fresh]
+
+    with stage("dedupe", len(coerced)):
+        seen: set[str] = set()
+        unique = []
+        for item, ts in coerced:
+            key = report.dedupe_key(item)
+            if key not in seen:
+                seen.add(key)
+                unique.append((item, ts))
+
+    with stage("score_item", len(unique)):
+        scored = [entry for entry in (report.score_item(item, ts, now_utc) for item, ts in unique) if entry]
+
+    with stage("sort", len(scored)):
+        scored.sort(key=lambda entry: (entry.score, entry.timestamp), reverse=True)
+
+    source_counts = report.summarize_sources(raw_items)
+    with stage("render_html", len(scored)):
+        html_report = report.render_html(now_utc.strftime("%Y-%m-%d"), scored, source_counts, len(raw_items))
+
+    reset_timestamp_state()
+    with stage("build_report_items", len(raw_items)):
+        published = report.build_report_items(raw_items, now_utc)
+
+    if len(published) != len(scored):
+        raise RuntimeError(f"Staged pipeline published {len(scored)} items, build_report_items {len(published)}")
+
+    return {
+        "items": size,
+        "items_published": len(scored),
+        "html_bytes": len(html_report.encode("utf-8")),
+        "stages": stages,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def fastest_run(attempts: list[dict[str, Any]]) -> dict[str, Any]:
+    run = attempts[0]
+    for name in run["stages"]:
+        run["stages"][name] = min((attempt["stages"][name] for attempt in attempts), key=lambda stage: stage["seconds"])
+    rss_readings = [attempt["peak_rss_mb"] for attempt in attempts if attempt["peak_rss_mb"] is not None]
+    run["peak_rss_mb"] = max(rss_readings) if rss_readings else None
+    run["attempts"] = len(attempts)
+    return run
+
+
+def git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def compare_runs(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    baseline_runs = {run["items"]: run for run in baseline.get("runs", [])}
+    print(f"Compared with {baseline.get('revision') or 'baseline'} (items/sec ratio, >1 is faster):")
+    for run in results["runs"]:
+        previous = baseline_runs.get(run["items"])
+        if previous is None:
+            continue
+        for name, current in run["stages"].items():
+            before = previous["stages"].get(name, {}).get("items_per_second")
+            after = current["items_per_second"]
+            if before and after:
+                print(f"  {run['items']:>7} {name:<20} {after / before:6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the PartnerAI report pipeline on synthetic payloads")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated payload sizes to benchmark",
+    )
+    parser.add_argument("--seed", type=int, default=2024, help="Random seed for the synthetic payloads")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per size; the fastest time of each stage is kept")
+    parser.add_argument("--output", default="", help="Results JSON path (default: benchmarks/results/<revision>.json)")
+    parser.add_argument("--baseline", default="", help="Earlier results JSON to compare throughput against")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    runs = []
+    for size in sizes:
+        attempts = []
+        for _ in range(max(1, args.repeat)):
+            # A fresh process per attempt keeps peak RSS readings independent.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                attempts.append(executor.submit(run_size, size, args.seed).result())
+        run = fastest_run(attempts)
+        runs.append(run)
+        rates = ", ".join(
+            f"{name}={stage['items_per_second']:.0f}/s" for name, stage in run["stages"].items() if stage["items_per_second"]
+        )
+        print(f"{size} items: published {run['items_published']}, peak RSS {run['peak_rss_mb']} MB; {rates}")
+
+    results = {
+        "revision": revision,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "runs": runs,
+    }
+    output = Path(args.output) if args.output else DEFAULT_OUTPUT_DIR / f"{revision or 'worktree'}.json"
+    report.write_json(output, results)
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        compare_runs(results, report.load_json(Path(args.baseline)))
+
+
+if __name__ == "__main__":
+    main()
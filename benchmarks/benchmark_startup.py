@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+SCRIPT = SRC_DIR / "partnerai_intel_report.py"
+sys.path.insert(0, str(SRC_DIR))
+
+from benchmark_pipeline import DEFAULT_OUTPUT_DIR, git_revision  # noqa: E402
+
+
+# Modules that only specific code paths need; importing the report module must not load them.
+DEFERRED_MODULES = (
+    "concurrent.futures.process",
+    "dateutil",
+    "http.client",
+    "http.server",
+    "jinja2",
+    "markupsafe",
+    "multiprocessing",
+    "sqlite3",
+    "urllib.request",
+)
+IMPORT_SNIPPET = f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); import partnerai_intel_report"
+
+
+def time_command(command: list[str], cwd: Path, repeat: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=cwd, check=True, capture_output=True)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+    }
+
+
+def import_profile(top: int) -> dict[str, Any]:
+    """Cumulative ``-X importtime`` microseconds for the report module and its slowest imports."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SNIPPET],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    slowest = sorted(modules.items(), key=lambda row: -row[1])[1 : top + 1]
+    return {
+        "module_cumulative_us": modules.get("partnerai_intel_report"),
+        "slowest_imports_us": dict(slowest),
+    }
+
+
+def eagerly_loaded_modules() -> list[str]:
+    probe = f"{IMPORT_SNIPPET}; print(','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return [name for name in completed.stdout.strip().split(",") if name]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PartnerAI report CLI import and startup time")
+    parser.add_argument("--repeat", type=int, default=15, help="Fresh interpreters per measurement; the median is kept")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list from -X importtime")
+    parser.add_argument("--output", default="", help="Results JSON path (default: benchmarks/results/<revision>-startup.json)")
+    parser.add_argument("--baseline", default="", help="Earlier startup results JSON to compare against")
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=0.0,
+        help="Exit non-zero when the median import time exceeds this many milliseconds (0 disables the check)",
+    )
+    args = parser.parse_args()
+
+    repeat = max(1, args.repeat)
+    revision = git_revision()
+    with tempfile.TemporaryDirectory() as workdir:
+        empty_payload = Path(workdir) / "empty-event.json"
+        empty_payload.write_text(json.dumps({"client_payload": {"items": []}}), encoding="utf-8")
+        timings = {
+            "interpreter": time_command([sys.executable, "-c", "pass"], Path(workdir), repeat),
+            "import": time_command([sys.executable, "-c", IMPORT_SNIPPET], Path(workdir), repeat),
+            # A payload without items exits before scoring, so this is the CLI's fixed startup cost.
+            "cli_no_items": time_command(
+                [sys.executable, str(SCRIPT), "--event-path", str(empty_payload), "--output-dir", "reports"],
+                Path(workdir),
+                repeat,
+            ),
+        }
+    eager = eagerly_loaded_modules()
+
+    results = {
+        "revision": revision,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "timings": timings,
+        "importtime": import_profile(args.top),
+        "eagerly_loaded": eager,
+    }
+    for name, timing in timings.items():
+        print(f"{name:<14} median {timing['median_ms']:>7.1f} ms  min {timing['min_ms']:>7.1f} ms")
+    print(f"Slowest imports (cumulative us): {results['importtime']['slowest_imports_us']}")
+
+    output = Path(args.output) if args.output else DEFAULT_OUTPUT_DIR / f"{revision or 'worktree'}-startup.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        print(f"Compared with {baseline.get('revision') or 'baseline'} (median ms, before -> after):")
+        for name, timing in timings.items():
+            before = baseline.get("timings", {}).get(name, {}).get("median_ms")
+            if before:
+                print(f"  {name:<14} {before:>7.1f} -> {timing['median_ms']:>7.1f}")
+
+    failures = []
+    if eager:
+        failures.append(f"importing partnerai_intel_report loaded deferred modules: {', '.join(eager)}")
+    if args.max_import_ms and timings["import"]["median_ms"] > args.max_import_ms:
+        failures.append(f"median import time {timings['import']['median_ms']} ms exceeds {args.max_import_ms} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
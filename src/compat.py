@@ -0,0 +1,8 @@
+"""
+Interpreter compatibility switches shared by the report modules
+"""
+import sys
+
+
+# __slots__ support in dataclasses needs Python 3.10; older interpreters get a plain frozen class
+SLOTTED = {"slots": True} if sys.version_info >= (3, 10) else {}
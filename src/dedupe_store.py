@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+
+class DedupeStore:
+    """On-disk index of dedupe keys processed by earlier report runs.
+
+    Keys and raw-item digests are loaded into memory when the store opens, so
+    lookups during a run are set membership checks. New entries and last-seen
+    updates are written in one transaction by ``commit``.
+    """
+
+    def __init__(self, path: Path, now_utc: datetime, check_same_thread: bool = True) -> None:
+        self.path = path
+        self.now_iso = now_utc.isoformat()
+        self.now_utc = now_utc
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(path), check_same_thread=check_same_thread)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen_items (
+                dedupe_key TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS raw_digests (
+                raw_digest TEXT PRIMARY KEY,
+                dedupe_key TEXT NOT NULL
+            );
+            """
+        )
+        self.known_keys = {row[0] for row in self.connection.execute("SELECT dedupe_key FROM seen_items")}
+        self.known_digests = dict(self.connection.execute("SELECT raw_digest, dedupe_key FROM raw_digests"))
+        self.new_keys: set[str] = set()
+        self.new_digests: dict[str, str] = {}
+        self.touched_keys: set[str] = set()
+        self.skipped = 0
+
+    def begin_run(self, now_utc: datetime) -> None:
+        """Start another run on an open store, dropping anything the last run did not commit."""
+        self.now_iso = now_utc.isoformat()
+        self.now_utc = now_utc
+        self.new_keys.clear()
+        self.new_digests.clear()
+        self.touched_keys.clear()
+        self.skipped = 0
+
+    @staticmethod
+    def raw_digest(raw_item: dict[str, Any]) -> str:
+        encoded = json.dumps(raw_item, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def seen_raw(self, digest: str) -> bool:
+        key = self.known_digests.get(digest)
+        if key is None:
+            return False
+        self.touched_keys.add(key)
+        self.skipped += 1
+        return True
+
+    def seen_key(self, key: str, digest: str) -> bool:
+        if key not in self.known_keys:
+            return False
+        self.touched_keys.add(key)
+        self.new_digests.setdefault(digest, key)
+        self.skipped += 1
+        return True
+
+    def record(self, key: str, digest: str) -> None:
+        if key not in self.known_keys:
+            self.new_keys.add(key)
+        self.new_digests.setdefault(digest, key)
+
+    def commit(self) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO seen_items (dedupe_key, first_seen, last_seen) VALUES (?, ?, ?)",
+                [(key, self.now_iso, self.now_iso) for key in sorted(self.new_keys)],
+            )
+            self.connection.executemany(
+                "UPDATE seen_items SET last_seen = ? WHERE dedupe_key = ?",
+                [(self.now_iso, key) for key in sorted(self.touched_keys)],
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO raw_digests (raw_digest, dedupe_key) VALUES (?, ?)",
+                sorted(self.new_digests.items()),
+            )
+        self.known_keys.update(self.new_keys)
+        self.known_digests.update(self.new_digests)
+        self.new_keys.clear()
+        self.new_digests.clear()
+        self.touched_keys.clear()
+
+    def compact(self, retention_days: int) -> int:
+        cutoff = (self.now_utc - timedelta(days=retention_days)).isoformat()
+        with self.connection:
+            removed = self.connection.execute("DELETE FROM seen_items WHERE last_seen < ?", (cutoff,)).rowcount
+            self.connection.execute(
+                "DELETE FROM raw_digests WHERE dedupe_key NOT IN (SELECT dedupe_key FROM seen_items)"
+            )
+        if removed:
+            self.known_keys = {row[0] for row in self.connection.execute("SELECT dedupe_key FROM seen_items")}
+            self.known_digests = dict(self.connection.execute("SELECT raw_digest, dedupe_key FROM raw_digests"))
+        return removed
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+
+INGEST_PATHS = {"/", "/ingest"}
+HEALTH_PATH = "/health"
+MAX_BODY_BYTES = 32 * 1024 * 1024
+
+
+class IngestBatcher:
+    """Collects pushed items and hands them to ``publish`` in micro-batches.
+
+    A batch is published once it holds ``max_items`` items or ``window_seconds``
+    after its first item arrived, whichever comes first. Batches are published
+    one at a time on a single worker thread, in arrival order; items pushed while
+    a batch is publishing start the next one.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[list[dict[str, Any]]], None],
+        max_items: int = 500,
+        window_seconds: float = 2.0,
+    ) -> None:
+        self.publish = publish
+        self.max_items = max(1, max_items)
+        self.window_seconds = max(0.0, window_seconds)
+        self.pending: list[dict[str, Any]] = []
+        self.batches_published = 0
+        self._first_pushed_at: float | None = None
+        self._closing = False
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="ingest-batcher", daemon=True)
+        self._worker.start()
+
+    def add(self, items: list[dict[str, Any]]) -> int:
+        with self._condition:
+            if self._first_pushed_at is None:
+                self._first_pushed_at = time.monotonic()
+            self.pending.extend(items)
+            self._condition.notify()
+            return len(self.pending)
+
+    def close(self) -> None:
+        """Publish whatever is pending and stop the worker."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify()
+        self._worker.join()
+
+    def _next_batch(self) -> list[dict[str, Any]] | None:
+        with self._condition:
+            while not self.pending and not self._closing:
+                self._condition.wait()
+            if not self.pending:
+                return None
+
+            deadline = (self._first_pushed_at or time.monotonic()) + self.window_seconds
+            while len(self.pending) < self.max_items and not self._closing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch, self.pending = self.pending[: self.max_items], self.pending[self.max_items :]
+            # Items left over from a full batch start the next window now.
+            self._first_pushed_at = time.monotonic() if self.pending else None
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self.publish(batch)
+            except Exception:
+                # Keep serving; one bad batch must not stop later ones from publishing.
+                traceback.print_exc()
+            else:
+                self.batches_published += 1
+
+
+class IngestServer(ThreadingHTTPServer):
+    """HTTP endpoint accepting Zapier-shaped JSON pushes.
+
+    ``POST /ingest`` (or ``/``) takes any payload ``extract_items`` understands
+    and answers 202 once its items are queued for the next batch.
+    ``GET /health`` reports the queue state.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        extract_items: Callable[[Any], list[dict[str, Any]]],
+        batcher: IngestBatcher,
+    ) -> None:
+        super().__init__(address, IngestRequestHandler)
+        self.extract_items = extract_items
+        self.batcher = batcher
+
+
+class IngestRequestHandler(BaseHTTPRequestHandler):
+    server: IngestServer
+    server_version = "PartnerAI-Ingest/1.0"
+
+    def do_GET(self) -> None:
+        if self.path != HEALTH_PATH:
+            self._reply(404, {"error": "Not found"})
+            return
+        batcher = self.server.batcher
+        self._reply(200, {"status": "ok", "pending": len(batcher.pending), "batches_published": batcher.batches_published})
+
+    def do_POST(self) -> None:
+        if self.path not in INGEST_PATHS:
+            self._reply(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self._reply(413 if length > MAX_BODY_BYTES else 400, {"error": "Invalid Content-Length"})
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except ValueError as exc:
+            self._reply(400, {"error": f"Invalid JSON: {exc}"})
+            return
+
+        items = self.server.extract_items(payload)
+        if not items:
+            self._reply(422, {"error": "No items found in payload"})
+            return
+        pending = self.server.batcher.add(items)
+        self._reply(202, {"accepted": len(items), "pending": pending})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Batches are logged when they publish; per-request access logs would drown them.
+        pass
+
+    def _reply(self, status: int, body: dict[str, Any]) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+
+NON_WHITESPACE_PATTERN = re.compile(r"\S")
+STRUCTURE_PATTERN = re.compile(r'["\[\]{}]')
+STRING_SPECIAL_PATTERN = re.compile(r'[\\"]')
+# Longest unread tail that can still extend a decoded number ("e+" in "1e+5").
+NUMBER_CONTINUATION_CHARS = 2
+
+
+class JsonStreamReader:
+    """Incremental JSON reader that keeps only the current value in memory.
+
+    ``iter_object`` and ``iter_array`` yield once per member; the caller must
+    consume each member with ``decode_value`` or ``skip_value`` before resuming.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = 65536) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = 0) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            match = NON_WHITESPACE_PATTERN.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return ""
+
+    def _expect(self, expected: str) -> None:
+        found = self.peek()
+        if found != expected:
+            raise ValueError(f"Expected {expected!r} in JSON stream, found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        self.peek()
+        # Each retry re-parses the value from its start, so reads double while one
+        # value stays incomplete to keep large values linear rather than quadratic.
+        read_size = self.chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self._fill(read_size):
+                    read_size *= 2
+                    continue
+                raise
+            # A number near the buffer edge may continue in the next chunk: "1." or
+            # "1e+" decode as 1 with the fraction or exponent still unread.
+            if type(value) in (int, float) and len(self.buffer) - end <= NUMBER_CONTINUATION_CHARS and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _skip_string(self) -> None:
+        index = self.pos + 1
+        while True:
+            match = STRING_SPECIAL_PATTERN.search(self.buffer, index)
+            if match is None or (match.group(0) == "\\" and match.end() >= len(self.buffer)):
+                # Drop the scanned text rather than carrying it into every refill; keep a trailing backslash.
+                self.pos = match.start() if match else len(self.buffer)
+                if not self._fill():
+                    raise ValueError("Unterminated string in JSON stream")
+                index = 0
+                continue
+            if match.group(0) == '"':
+                self.pos = match.end()
+                return
+            index = match.end() + 1
+
+    def skip_value(self) -> None:
+        token = self.peek()
+        if token == '"':
+            self._skip_string()
+            return
+        if token not in ("[", "{"):
+            self.decode_value()
+            return
+
+        depth = 0
+        while True:
+            match = STRUCTURE_PATTERN.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    raise ValueError("Unexpected end of JSON stream")
+                continue
+            self.pos = match.start()
+            token = match.group(0)
+            if token == '"':
+                self._skip_string()
+                continue
+            self.pos += 1
+            if token in ("[", "{"):
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def iter_object(self) -> Iterator[str]:
+        self._expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.decode_value()
+            self._expect(":")
+            yield str(key)
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' in JSON object, found {separator or 'end of input'!r}")
+
+    def iter_array(self) -> Iterator[None]:
+        self._expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield None
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {separator or 'end of input'!r}")
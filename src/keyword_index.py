@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Hashable, Iterable
+
+
+class KeywordHits:
+    """Keyword hits for one lowered text, resolved on demand and grouped by rule.
+
+    Each distinct term is tested against the text at most once, however many
+    rules or callers ask for it.
+    """
+
+    def __init__(self, text: str, rules: dict[Hashable, tuple[str, ...]], parent: KeywordHits | None = None) -> None:
+        self.text = text
+        self.rules = rules
+        self.parent = parent
+        self.found: dict[str, bool] = {}
+
+    def within(self, limit: int) -> KeywordHits:
+        return KeywordHits(self.text[:limit], self.rules, parent=self)
+
+    def _probe(self, term: str) -> bool:
+        # A term missing from the full text cannot appear in a prefix of it.
+        if self.parent is not None and self.parent.found.get(term) is False:
+            found = False
+        else:
+            found = term in self.text
+        self.found[term] = found
+        return found
+
+    def has(self, term: str) -> bool:
+        found = self.found.get(term)
+        if found is None:
+            return self._probe(term)
+        return found
+
+    def matched(self, rule: Hashable) -> list[str]:
+        return [term for term in self.rules.get(rule, ()) if self.has(term)]
+
+    def count(self, rule: Hashable) -> int:
+        cached = self.found
+        total = 0
+        for term in self.rules.get(rule, ()):
+            found = cached.get(term)
+            if found is None:
+                found = self._probe(term)
+            if found:
+                total += 1
+        return total
+
+    def any(self, rule: Hashable) -> bool:
+        cached = self.found
+        for term in self.rules.get(rule, ()):
+            found = cached.get(term)
+            if found is None:
+                found = self._probe(term)
+            if found:
+                return True
+        return False
+
+    def grouped(self) -> dict[Hashable, list[str]]:
+        return {rule: terms for rule in self.rules if (terms := self.matched(rule))}
+
+
+class KeywordIndex:
+    """Keyword rule tables merged into one index shared by every classifier."""
+
+    def __init__(self, rules: dict[Hashable, Iterable[str]]) -> None:
+        self.rules = {rule: tuple(terms) for rule, terms in rules.items()}
+
+    def scan(self, lowered_text: str) -> KeywordHits:
+        return KeywordHits(lowered_text, self.rules)
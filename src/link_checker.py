@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import string
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import quote, urljoin, urlsplit
+
+
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+MAX_REDIRECTIONS = 10
+MAX_REPEATS = 4
+USER_AGENT = "PartnerAI-LinkValidator/1.0"
+
+
+def link_status_ok(status_code: int) -> bool:
+    return (200 <= status_code < 400) or status_code in {401, 403}
+
+
+class HttpStatusError(Exception):
+    def __init__(self, code: int, reason: str) -> None:
+        super().__init__(f"HTTP Error {code}: {reason}")
+        self.code = code
+        self.reason = reason
+
+
+class ForeignRedirect(Exception):
+    pass
+
+
+class ConcurrentLinkChecker:
+    """Thread-pooled URL checker with per-host limits and keep-alive connections.
+
+    ``check`` follows the same contract as ``check_url``: a HEAD request with a
+    GET fallback on 405/501, redirects followed the way urllib follows them, and
+    ``(status_code, detail)`` results where status 0 means the request failed.
+    URLs the pool cannot reproduce exactly, such as redirects to ftp://, are
+    handed to ``serial_check``; ``serial_only`` routes every URL there.
+    ``on_checked`` receives each URL with the seconds its check took.
+
+    ``check_many`` queues URLs per host and only hands a URL to the pool when
+    its host has a free slot and its politeness delay has passed, so workers are
+    never parked waiting on one busy host while others have work. The limits
+    apply per checked URL; its GET fallback and redirects run in the same slot.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        serial_check: Callable[[str, float], tuple[int, str]],
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        per_host_delay: float = 0.0,
+        serial_only: bool = False,
+        on_checked: Callable[[str, float], None] | None = None,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.serial_check = serial_check
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.per_host_delay = max(0.0, per_host_delay)
+        self.serial_only = serial_only
+        self.on_checked = on_checked
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int | None], list[http.client.HTTPConnection]] = {}
+
+    def check_many(self, urls: list[str]) -> list[tuple[int, str]]:
+        if not urls:
+            return []
+        check = self.check if self.on_checked is None else self._check_and_report
+        results: list[tuple[int, str]] = [(0, "")] * len(urls)
+        queued: dict[str, deque[int]] = {}
+        for index, url in enumerate(urls):
+            queued.setdefault(urlsplit(url).netloc.lower(), deque()).append(index)
+        running: dict[Future, tuple[str, int]] = {}
+        active: dict[str, int] = {}
+        next_start: dict[str, float] = {}
+        workers = min(self.max_workers, len(urls))
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while queued or running:
+                    now = time.monotonic()
+                    wake_at: float | None = None
+                    for host in list(queued):
+                        while len(running) < workers and active.get(host, 0) < self.per_host_limit:
+                            start_at = next_start.get(host, now)
+                            if start_at > now:
+                                wake_at = start_at if wake_at is None else min(wake_at, start_at)
+                                break
+                            index = queued[host].popleft()
+                            running[executor.submit(check, urls[index])] = (host, index)
+                            active[host] = active.get(host, 0) + 1
+                            next_start[host] = now + self.per_host_delay
+                            if not queued[host]:
+                                del queued[host]
+                                break
+
+                    if not running:
+                        # Every queued host is waiting out its politeness delay.
+                        time.sleep(max(0.0, (wake_at or now) - time.monotonic()))
+                        continue
+                    timeout = None if wake_at is None else max(0.0, wake_at - time.monotonic())
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        host, index = running.pop(future)
+                        active[host] -= 1
+                        results[index] = future.result()
+            return results
+        finally:
+            self.close()
+
+    def check(self, url: str) -> tuple[int, str]:
+        parsed = urlsplit(url)
+        if parsed.scheme not in {"http", "https"}:
+            return 0, "unsupported URL scheme"
+        if self.serial_only:
+            return self.serial_check(url, self.timeout_seconds)
+
+        try:
+            return self._fetch(url, "HEAD")
+        except HttpStatusError as exc:
+            if exc.code in {405, 501}:
+                try:
+                    return self._fetch(url, "GET")
+                except HttpStatusError as get_exc:
+                    return get_exc.code, get_exc.reason or "HTTP error"
+                except ForeignRedirect:
+                    return self.serial_check(url, self.timeout_seconds)
+                except Exception as get_exc:
+                    return 0, str(get_exc)
+            return exc.code, exc.reason or "HTTP error"
+        except ForeignRedirect:
+            return self.serial_check(url, self.timeout_seconds)
+        except Exception as exc:
+            return 0, str(exc)
+
+    def _check_and_report(self, url: str) -> tuple[int, str]:
+        started = time.monotonic()
+        result = self.check(url)
+        self.on_checked(url, time.monotonic() - started)
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [connection for connections in self._idle.values() for connection in connections]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def _fetch(self, url: str, method: str) -> tuple[int, str]:
+        visited: dict[str, int] = {}
+        while True:
+            code, reason, location = self._request(url, method)
+            if 200 <= code < 300:
+                return code, ""
+            if code not in REDIRECT_CODES or location is None:
+                raise HttpStatusError(code, reason)
+
+            new_url = quote(urljoin(url, location), encoding="iso-8859-1", safe=string.punctuation)
+            scheme = urlsplit(new_url).scheme
+            if scheme == "ftp":
+                raise ForeignRedirect(new_url)
+            if scheme not in {"http", "https"}:
+                raise HttpStatusError(code, f"{reason} - Redirection to url '{new_url}' is not allowed")
+            if visited.get(new_url, 0) >= MAX_REPEATS or len(visited) >= MAX_REDIRECTIONS:
+                raise HttpStatusError(
+                    code,
+                    "The HTTP server returned a redirect error that would lead to an infinite loop.\n"
+                    f"The last 30x error message was:\n{reason}",
+                )
+            visited[new_url] = visited.get(new_url, 0) + 1
+            url = new_url
+
+    def _request(self, url: str, method: str) -> tuple[int, str, str | None]:
+        parsed = urlsplit(url)
+        pool_key = (parsed.scheme, (parsed.hostname or "").lower(), parsed.port)
+        selector = parsed.path or "/"
+        if parsed.query:
+            selector = f"{selector}?{parsed.query}"
+        headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+
+        connection, reused = self._acquire(pool_key)
+        try:
+            try:
+                connection.request(method, selector, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one.
+                connection.close()
+                connection, reused = self._acquire(pool_key, fresh=True)
+                connection.request(method, selector, headers=headers)
+                response = connection.getresponse()
+
+            location = response.getheader("location") or response.getheader("uri")
+            if method == "HEAD" and not response.will_close:
+                response.read()
+                self._release(pool_key, connection)
+            else:
+                connection.close()
+            return response.status, response.reason or "", location
+        except BaseException:
+            connection.close()
+            raise
+
+    def _acquire(self, pool_key: tuple[str, str, int | None], fresh: bool = False) -> tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(pool_key)
+                if idle:
+                    return idle.pop(), True
+
+        scheme, host, port = pool_key
+        if ":" in host:
+            host = f"[{host}]"
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=self.timeout_seconds), False
+
+    def _release(self, pool_key: tuple[str, str, int | None], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(pool_key, []).append(connection)
+
+
+class LinkCheckCache:
+    """Persistent URL -> (status_code, detail, checked_at) results of earlier link checks.
+
+    Healthy results are reused for ``ok_ttl``; failures expire after the shorter
+    ``error_ttl`` so they are retried soon. ``refresh`` ignores stored results;
+    ``offline`` accepts any stored result, however old, and never probes.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        now_utc: datetime,
+        ok_ttl: timedelta,
+        error_ttl: timedelta,
+        refresh: bool = False,
+        offline: bool = False,
+    ) -> None:
+        self.path = path
+        self.now_utc = now_utc
+        self.ok_ttl = ok_ttl
+        self.error_ttl = error_ttl
+        self.refresh = refresh
+        self.offline = offline
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if path.exists():
+            try:
+                with path.open("r", encoding="utf-8") as file:
+                    stored = json.load(file)
+            except (OSError, ValueError):
+                # A truncated or conflicted cache file only costs fresh checks, never the run.
+                stored = {}
+            if isinstance(stored, dict) and isinstance(stored.get("entries"), dict):
+                self.entries = stored["entries"]
+
+    def begin_run(self, now_utc: datetime) -> None:
+        """Reuse the loaded entries for another run at ``now_utc``."""
+        self.now_utc = now_utc
+        self.hits = 0
+        self.misses = 0
+
+    def _expires_at(self, entry: dict[str, Any]) -> datetime | None:
+        try:
+            checked_at = datetime.fromisoformat(str(entry["checked_at"]))
+            status_code = int(entry["status_code"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return checked_at + (self.ok_ttl if link_status_ok(status_code) else self.error_ttl)
+
+    def lookup(self, url: str) -> tuple[int, str] | None:
+        entry = self.entries.get(url)
+        if entry is None or self.refresh:
+            self.misses += 1
+            return None
+        expires_at = self._expires_at(entry)
+        if expires_at is None or (expires_at <= self.now_utc and not self.offline):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return int(entry["status_code"]), str(entry.get("detail") or "")
+
+    def store(self, url: str, status_code: int, detail: str) -> None:
+        self.entries[url] = {
+            "status_code": status_code,
+            "detail": detail,
+            "checked_at": self.now_utc.isoformat(),
+        }
+
+    def save(self) -> None:
+        live_entries = {}
+        for url in sorted(self.entries):
+            expires_at = self._expires_at(self.entries[url])
+            if expires_at is not None and expires_at > self.now_utc:
+                live_entries[url] = self.entries[url]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            json.dump({"version": 1, "entries": live_entries}, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+        os.replace(temp_path, self.path)
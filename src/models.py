@@ -1,12 +1,55 @@
 """
 Market Intelligence Opportunity Data Model
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import yaml
 
-@dataclass
+from compat import SLOTTED
+
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+DATE_FIELDS = ("deadline", "published_date")
+
+
+def load_vocabularies(config_path: Path = CONFIG_PATH) -> Dict[str, List[str]]:
+    """Load the countries, sectors and opportunity types declared in config.yaml"""
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+    return {key: list(config[key]) for key in ("countries", "sectors", "opportunity_types")}
+
+
+VOCABULARIES = load_vocabularies()
+VALID_COUNTRIES = frozenset(VOCABULARIES["countries"])
+VALID_SECTORS = frozenset(VOCABULARIES["sectors"])
+VALID_TYPES = frozenset(VOCABULARIES["opportunity_types"])
+
+
+def vocabulary_errors(country: str, sector: str, opportunity_type: str) -> List[str]:
+    """Return a message for each value outside the configured vocabularies"""
+    errors = []
+    if country not in VALID_COUNTRIES:
+        errors.append(f"Country must be one of {VOCABULARIES['countries']}")
+    if sector not in VALID_SECTORS:
+        errors.append(f"Sector must be one of {VOCABULARIES['sectors']}")
+    if opportunity_type not in VALID_TYPES:
+        errors.append(f"Opportunity type must be one of {VOCABULARIES['opportunity_types']}")
+    return errors
+
+
+# Indexes built together in one pass the first time any grouping is requested
+DEFAULT_INDEX_FIELDS = (
+    ("country",),
+    ("sector",),
+    ("opportunity_type",),
+    ("country", "sector"),
+)
+
+
+@dataclass(frozen=True, **SLOTTED)
 class Opportunity:
     """Represents a funding opportunity"""
     
@@ -23,41 +66,121 @@ class Opportunity:
     
     def __post_init__(self):
         """Validate the opportunity data"""
-        valid_countries = ["Bolivia", "Bangladesh", "Myanmar"]
-        valid_sectors = [
-            "Agribusiness",
-            "Ranching and livestock",
-            "Fisheries and aquaculture",
-            "Climate and environment"
-        ]
-        valid_types = ["Grants", "Tenders", "Subsidies", "Development programs"]
+        errors = vocabulary_errors(self.country, self.sector, self.opportunity_type)
+        if errors:
+            raise ValueError(errors[0])
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> Tuple[List["Opportunity"], List[str]]:
+        """Build opportunities from JSON records, collecting every error instead of stopping at the first
         
-        if self.country not in valid_countries:
-            raise ValueError(f"Country must be one of {valid_countries}")
-        if self.sector not in valid_sectors:
-            raise ValueError(f"Sector must be one of {valid_sectors}")
-        if self.opportunity_type not in valid_types:
-            raise ValueError(f"Opportunity type must be one of {valid_types}")
+        Returns the valid opportunities and one message per problem, prefixed with the record index.
+        """
+        opportunities = []
+        errors = []
+        for index, record in enumerate(records):
+            missing = [name for name in ("title", "country", "sector", "opportunity_type", "description") if name not in record]
+            if missing:
+                errors.extend(f"Record {index}: missing field '{name}'" for name in missing)
+                continue
+            
+            record_errors = vocabulary_errors(record['country'], record['sector'], record['opportunity_type'])
+            dates = {}
+            for name in DATE_FIELDS:
+                try:
+                    dates[name] = datetime.fromisoformat(record[name]) if record.get(name) else None
+                except (TypeError, ValueError):
+                    record_errors.append(f"Invalid {name} date: {record[name]!r}")
+            if record_errors:
+                errors.extend(f"Record {index}: {message}" for message in record_errors)
+                continue
+            
+            opportunities.append(cls(
+                title=record['title'],
+                country=record['country'],
+                sector=record['sector'],
+                opportunity_type=record['opportunity_type'],
+                description=record['description'],
+                amount=record.get('amount'),
+                source=record.get('source'),
+                url=record.get('url'),
+                **dates
+            ))
+        return opportunities, errors
 
 
 @dataclass
 class Report:
-    """Represents a complete market intelligence report"""
+    """Represents a complete market intelligence report
+    
+    Grouping lookups are served from indexes built lazily and cached. They are
+    rebuilt when ``opportunities`` is reassigned or changes length; call
+    ``invalidate_indexes`` after editing opportunities in place.
+    """
     
     title: str
     report_date: datetime
     opportunities: List[Opportunity]
     countries: List[str]
     sectors: List[str]
+    _indexes: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], List[Opportunity]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "opportunities":
+            self.__dict__["_indexes"] = {}
+        super().__setattr__(name, value)
+    
+    def invalidate_indexes(self) -> None:
+        """Drop cached indexes after opportunities are edited in place"""
+        self._indexes = {}
+    
+    def _current_indexes(self) -> Dict[Tuple[str, ...], Dict[Tuple[Any, ...], List[Opportunity]]]:
+        if self._indexed_count != len(self.opportunities):
+            self._indexes = {}
+            self._indexed_count = len(self.opportunities)
+        if not self._indexes:
+            indexes: Dict[Tuple[str, ...], Dict[Tuple[Any, ...], List[Opportunity]]] = {
+                fields: {} for fields in DEFAULT_INDEX_FIELDS
+            }
+            for opp in self.opportunities:
+                for fields, index in indexes.items():
+                    key = tuple(getattr(opp, name) for name in fields)
+                    index.setdefault(key, []).append(opp)
+            self._indexes = indexes
+        return self._indexes
+    
+    def index_by(self, *fields: str) -> Dict[Tuple[Any, ...], List[Opportunity]]:
+        """Bucket opportunities by the given attributes, keyed by value tuples"""
+        indexes = self._current_indexes()
+        index = indexes.get(fields)
+        if index is None:
+            index = {}
+            for opp in self.opportunities:
+                index.setdefault(tuple(getattr(opp, name) for name in fields), []).append(opp)
+            indexes[fields] = index
+        return index
+    
+    def get_opportunities(self, **criteria: Any) -> List[Opportunity]:
+        """Filter opportunities matching every given attribute value"""
+        fields = tuple(sorted(criteria))
+        bucket = self.index_by(*fields).get(tuple(criteria[name] for name in fields), [])
+        return list(bucket)
     
     def get_opportunities_by_country(self, country: str) -> List[Opportunity]:
         """Filter opportunities by country"""
-        return [opp for opp in self.opportunities if opp.country == country]
+        return self.get_opportunities(country=country)
     
     def get_opportunities_by_sector(self, sector: str) -> List[Opportunity]:
         """Filter opportunities by sector"""
-        return [opp for opp in self.opportunities if opp.sector == sector]
+        return self.get_opportunities(sector=sector)
     
     def get_opportunities_by_type(self, opp_type: str) -> List[Opportunity]:
         """Filter opportunities by type"""
-        return [opp for opp in self.opportunities if opp.opportunity_type == opp_type]
+        return self.get_opportunities(opportunity_type=opp_type)
+    
+    def get_opportunities_by_country_and_sector(self, country: str, sector: str) -> List[Opportunity]:
+        """Filter opportunities by country and sector"""
+        return self.get_opportunities(country=country, sector=sector)
@@ -14,6 +14,8 @@ import sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from report_output import publish_text
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -411,12 +413,10 @@ class PrimaryResearchReportGenerator:
         report_filename = f"partnerai-intel-report-{report_date}.html"
         report_path = self.output_dir / report_filename
         
-        report_path.write_text(html_content, encoding="utf-8")
-        logger.info(f"Report saved: {report_path}")
-        
-        # Also save as latest.html
+        # Written once; latest.html is linked to the same file
         latest_path = self.output_dir / "latest.html"
-        latest_path.write_text(html_content, encoding="utf-8")
+        publish_text(report_path, [html_content], aliases=[latest_path])
+        logger.info(f"Report saved: {report_path}")
         logger.info(f"Latest report saved: {latest_path}")
         
         return report_path
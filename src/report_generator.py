@@ -88,21 +88,11 @@ def main():
         with open(data_file, 'r') as f:
             data = json.load(f)
         
-        opportunities = []
-        for opp_data in data.get('opportunities', []):
-            opp = Opportunity(
-                title=opp_data['title'],
-                country=opp_data['country'],
-                sector=opp_data['sector'],
-                opportunity_type=opp_data['opportunity_type'],
-                description=opp_data['description'],
-                amount=opp_data.get('amount'),
-                deadline=datetime.fromisoformat(opp_data['deadline']) if opp_data.get('deadline') else None,
-                source=opp_data.get('source'),
-                url=opp_data.get('url'),
-                published_date=datetime.fromisoformat(opp_data['published_date']) if opp_data.get('published_date') else None
-            )
-            opportunities.append(opp)
+        opportunities, errors = Opportunity.from_records(data.get('opportunities', []))
+        if errors:
+            for error in errors:
+                print(error, file=sys.stderr)
+            sys.exit(f"Found {len(errors)} problem(s) in the opportunity records of {data_file}")
     else:
         # Use sample data
         opportunities = []
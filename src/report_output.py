@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+
+def temp_path_for(path: Path) -> Path:
+    return path.with_name(f".{path.name}.tmp")
+
+
+def link_or_copy(source: Path, target: Path) -> None:
+    if target.exists() and os.path.samefile(source, target):
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = temp_path_for(target)
+    temp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        # Cross-device targets and filesystems without hardlinks get a plain copy.
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, target)
+
+
+def publish_text(path: Path, chunks: Iterable[str], aliases: Iterable[Path] = ()) -> int:
+    """Write ``chunks`` to ``path`` once and expose the same file under ``aliases``.
+
+    Every name is swapped into place with an atomic rename, so readers see either
+    the previous file or the complete new one. Aliases are hardlinks to ``path``
+    where the filesystem allows it and copies otherwise. Returns the size of
+    ``path`` in bytes.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = temp_path_for(path)
+    try:
+        with temp_path.open("w", encoding="utf-8") as file:
+            file.writelines(chunks)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    os.replace(temp_path, path)
+
+    for alias in aliases:
+        link_or_copy(path, alias)
+    return path.stat().st_size
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, TypeVar
+
+
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+T = TypeVar("T")
+
+
+class RunMetrics:
+    """Per-run stage timings, counters and latency histograms.
+
+    Nothing here runs unless a caller holds a ``RunMetrics``; pipeline code keeps
+    ``metrics=None`` on the fast path and only wraps work when metrics are on.
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, list[int]] = {}
+        self.histogram_totals: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def add_time(self, stage: str, seconds: float, calls: int = 1) -> None:
+        totals = self.stages.get(stage)
+        if totals is None:
+            totals = self.stages[stage] = {"seconds": 0.0, "calls": 0}
+        totals["seconds"] += seconds
+        totals["calls"] += calls
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def timed(self, stage: str, function: Callable[..., T]) -> Callable[..., T]:
+        perf_counter = time.perf_counter
+        add_time = self.add_time
+
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            started = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add_time(stage, perf_counter() - started)
+
+        return wrapper
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe_ms(self, histogram: str, milliseconds: float) -> None:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, milliseconds)
+        with self._lock:
+            counts = self.histograms.get(histogram)
+            if counts is None:
+                counts = self.histograms[histogram] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            counts[bucket] += 1
+            self.histogram_totals[histogram] = self.histogram_totals.get(histogram, 0.0) + milliseconds
+
+    def to_dict(self) -> dict[str, Any]:
+        histograms = {}
+        for name, counts in self.histograms.items():
+            labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            observed = sum(counts)
+            histograms[name] = {
+                "count": observed,
+                "mean_ms": round(self.histogram_totals[name] / observed, 1) if observed else 0.0,
+                "buckets": dict(zip(labels, counts)),
+            }
+        return {
+            "wall_seconds": round(time.perf_counter() - self._started, 6),
+            "stages": {
+                name: {"seconds": round(totals["seconds"], 6), "calls": int(totals["calls"])}
+                for name, totals in self.stages.items()
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "histograms": histograms,
+        }
+
+    def format_table(self) -> str:
+        data = self.to_dict()
+        lines = [f"Run metrics (wall {data['wall_seconds']:.3f}s)"]
+        if data["stages"]:
+            lines.append(f"{'stage':<24} {'seconds':>10} {'calls':>9}")
+            for name, totals in data["stages"].items():
+                lines.append(f"{name:<24} {totals['seconds']:>10.3f} {totals['calls']:>9}")
+        if data["counters"]:
+            lines.append(f"{'counter':<24} {'value':>10}")
+            for name, value in data["counters"].items():
+                lines.append(f"{name:<24} {value:>10}")
+        for name, histogram in data["histograms"].items():
+            lines.append(f"{name} (n={histogram['count']}, mean {histogram['mean_ms']}ms)")
+            for label, value in histogram["buckets"].items():
+                lines.append(f"  {label:<22} {value:>10}")
+        return "\n".join(lines)
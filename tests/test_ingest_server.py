@@ -0,0 +1,156 @@
+import json
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ingest_server import IngestBatcher, IngestServer
+import partnerai_intel_report as report
+from partnerai_intel_report import extract_items
+
+
+class RecordingPublisher:
+    def __init__(self):
+        self.batches = []
+        self.published = threading.Event()
+
+    def __call__(self, batch):
+        self.batches.append(batch)
+        self.published.set()
+
+
+def make_items(count, start=0):
+    return [{"title": f"Item {index}", "url": f"https://example.net/{index}"} for index in range(start, start + count)]
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for condition")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def ingest_server():
+    publisher = RecordingPublisher()
+    batcher = IngestBatcher(publisher, max_items=100, window_seconds=0.3)
+    server = IngestServer(("127.0.0.1", 0), extract_items, batcher)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", publisher
+    server.shutdown()
+    server.server_close()
+    batcher.close()
+
+
+def call(base, method, path, body=None):
+    request = urllib.request.Request(base + path, data=body, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_rejects_bad_requests(ingest_server):
+    base, publisher = ingest_server
+    assert call(base, "POST", "/ingest", b"{bad")[0] == 400
+    assert call(base, "POST", "/ingest", b'{"x": 1}') == (422, {"error": "No items found in payload"})
+    assert call(base, "POST", "/elsewhere", b"{}")[0] == 404
+    assert call(base, "GET", "/elsewhere")[0] == 404
+    assert call(base, "GET", "/health") == (200, {"status": "ok", "pending": 0, "batches_published": 0})
+    assert publisher.batches == []
+
+
+def test_pushes_within_the_window_publish_one_batch(ingest_server):
+    base, publisher = ingest_server
+    items = make_items(60)
+    for start in range(0, 60, 12):
+        payload = {"client_payload": {"items": items[start : start + 12]}}
+        status, body = call(base, "POST", "/ingest", json.dumps(payload).encode())
+        assert (status, body["accepted"]) == (202, 12)
+
+    wait_for(lambda: call(base, "GET", "/health")[1]["batches_published"] == 1)
+    assert publisher.batches == [items]
+
+
+def test_large_push_is_split_at_max_items(ingest_server):
+    base, publisher = ingest_server
+    items = make_items(250)
+    assert call(base, "POST", "/", json.dumps({"items": items}).encode()) == (202, {"accepted": 250, "pending": 250})
+
+    wait_for(lambda: call(base, "GET", "/health")[1]["batches_published"] == 3)
+    assert [len(batch) for batch in publisher.batches] == [100, 100, 50]
+    assert [item for batch in publisher.batches for item in batch] == items
+
+
+def test_close_publishes_pending_items():
+    publisher = RecordingPublisher()
+    batcher = IngestBatcher(publisher, max_items=100, window_seconds=60)
+    batcher.add(make_items(3))
+    batcher.close()
+    assert publisher.batches == [make_items(3)]
+
+
+def test_failed_batch_does_not_stop_later_batches(capsys):
+    batches = []
+
+    def publish(batch):
+        batches.append(batch)
+        if len(batches) == 1:
+            raise RuntimeError("publish failed")
+
+    batcher = IngestBatcher(publish, max_items=2, window_seconds=60)
+    batcher.add(make_items(4))
+    wait_for(lambda: batcher.batches_published == 1)
+    batcher.close()
+    assert batches == [make_items(2), make_items(2, start=2)]
+    assert "publish failed" in capsys.readouterr().err
+
+
+def test_serve_with_dedupe_store_skips_items_seen_in_earlier_batches(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    report.reset_run_counters()
+    args = report.build_parser().parse_args(
+        ["--serve", "--serve-port", "0", "--output-dir", "reports", "--dedupe-store", "dedupe.sqlite", "--batch-window", "0"]
+    )
+    now_utc = datetime.now(timezone.utc)
+    first = [
+        {
+            "title": f"Bolivia agribusiness grant program {index} opens call for proposals",
+            "description": "Funding of $500,000 is available for smallholder farmers and rural cooperatives.",
+            "source": "World Bank",
+            "url": f"https://projects.partner{index}.org/items/{index}",
+            "published_date": (now_utc - timedelta(hours=index + 1)).replace(tzinfo=None).isoformat(timespec="seconds"),
+        }
+        for index in range(3)
+    ]
+    second = first[:2] + [dict(first[2], url="https://projects.partner9.org/items/9", title="Second batch grant call")]
+
+    # Opened on this thread and used on the batcher thread, as serve_payloads does.
+    store = report.open_dedupe_store(args, now_utc, check_same_thread=False)
+    server = report.build_ingest_server(args, store, None)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        for batch_number, items in enumerate((first, second), start=1):
+            assert call(base, "POST", "/ingest", json.dumps({"items": items}).encode())[0] == 202
+            wait_for(lambda: call(base, "GET", "/health")[1]["batches_published"] == batch_number)
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.close()
+        store.close()
+
+    output = capsys.readouterr()
+    assert "Traceback" not in output.err
+    assert "Items skipped as previously processed: 0" in output.out
+    assert "Items skipped as previously processed: 2" in output.out
+    manifest = json.loads((tmp_path / "reports" / "latest-report.manifest.json").read_text())
+    assert manifest["items_published"] == 1
+    with sqlite3.connect(tmp_path / "dedupe.sqlite") as connection:
+        assert connection.execute("SELECT COUNT(*) FROM seen_items").fetchone()[0] == 4
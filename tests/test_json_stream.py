@@ -0,0 +1,126 @@
+import io
+import json
+
+import pytest
+
+from json_stream import JsonStreamReader
+from partnerai_intel_report import (
+    extract_items,
+    follow_item_stream,
+    plan_file_items,
+    plan_item_stream,
+    stream_file_items,
+)
+
+PAYLOAD = {
+    "a": 1.5,
+    "b": -2.25e-3,
+    "c": 10e+4,
+    "d": [0, -0.5, 1E7, 12345678901234567890],
+    "items": [
+        {"title": "Grant call", "url": "https://example.net/1", "score": 3.75},
+        {"title": "Tender", "url": "https://example.net/2", "ratio": 1e-2},
+    ],
+}
+
+
+def stream_items(text, chunk_size):
+    plan = plan_item_stream(JsonStreamReader(io.StringIO(text), chunk_size=chunk_size))
+    return list(follow_item_stream(JsonStreamReader(io.StringIO(text), chunk_size=chunk_size), plan))
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_decode_value_numbers_split_across_chunks(chunk_size):
+    text = json.dumps(PAYLOAD)
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    assert reader.decode_value() == PAYLOAD
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_streamed_items_match_extract_items_for_every_chunk_size(chunk_size):
+    text = json.dumps(PAYLOAD)
+    assert stream_items(text, chunk_size) == extract_items(PAYLOAD)
+
+
+def test_number_split_after_decimal_point_at_default_chunk_boundary():
+    prefix = '{"client_payload": {"pad": "'
+    suffix = '", "ratio": 1.5, "items": [{"title": "t", "url": "https://example.net/x"}]}}'
+    # Pad so the default 64 KiB chunk ends right after "1.".
+    padding = 65536 - len(prefix) - len(suffix[: suffix.index("1.5") + 2])
+    text = prefix + "x" * padding + suffix
+    assert text[65534:65536] == "1."
+    assert stream_items(text, 65536) == extract_items(json.loads(text))
+
+
+def test_skip_value_scalars_split_across_chunks():
+    text = '[1.5e+3, "a\\"b", 2.0, {"k": [true, null]}, -7]'
+    for chunk_size in range(1, 8):
+        reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+        for _ in reader.iter_array():
+            reader.skip_value()
+        assert reader.peek() == ""
+
+
+class CountingReader(io.StringIO):
+    """Records each read so tests can check how much a reader buffers and re-reads."""
+
+    def __init__(self, text):
+        super().__init__(text)
+        self.reads = 0
+        self.reader = None
+        self.largest_buffer = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        if self.reader is not None:
+            self.largest_buffer = max(self.largest_buffer, len(self.reader.buffer) - self.reader.pos)
+        return super().read(size)
+
+
+def test_skipping_a_large_string_keeps_the_buffer_bounded():
+    text = json.dumps(['x\\y"' + "z" * (4 * 1024 * 1024), 7])
+    file = CountingReader(text)
+    reader = file.reader = JsonStreamReader(file, chunk_size=65536)
+    values = []
+    for _ in reader.iter_array():
+        if reader.peek() == '"':
+            reader.skip_value()
+        else:
+            values.append(reader.decode_value())
+    assert values == [7]
+    assert file.largest_buffer <= 2
+
+
+def test_decoding_a_large_value_reads_in_growing_chunks():
+    value = {"content": "z" * (4 * 1024 * 1024), "title": "t"}
+    file = CountingReader(json.dumps(value))
+    assert JsonStreamReader(file, chunk_size=65536).decode_value() == value
+    # 4 MiB in 64 KiB chunks would take 64 reads; doubling needs about log2(64).
+    assert file.reads <= 10
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_skip_strings_with_escapes_across_chunks(chunk_size):
+    strings = ["a\\b", '"', "\\", "\\\\\"", "tail\\"]
+    text = json.dumps(strings + [{"k": strings}, 3])
+    reader = JsonStreamReader(io.StringIO(text), chunk_size=chunk_size)
+    kept = []
+    for _ in reader.iter_array():
+        if reader.peek() in '"{':
+            reader.skip_value()
+        else:
+            kept.append(reader.decode_value())
+    assert kept == [3]
+    assert reader.peek() == ""
+
+
+def test_text_payload_items_come_from_the_plan(tmp_path):
+    inner = {"items": PAYLOAD["items"]}
+    path = tmp_path / "event.json"
+    path.write_text(json.dumps({"client_payload": json.dumps(inner)}), encoding="utf-8")
+
+    plan = plan_file_items(path, prefer_key="client_payload")
+    assert plan.kind == "text"
+    assert plan.items == extract_items(inner)
+    path.unlink()
+    assert list(stream_file_items(path, plan)) == extract_items(inner)
@@ -0,0 +1,151 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from link_checker import ConcurrentLinkChecker, LinkCheckCache
+from partnerai_intel_report import check_url
+
+STUB_PATHS = [
+    "/ok",
+    "/ok/a b",
+    "/missing",
+    "/nohead",
+    "/nohead404",
+    "/notimpl",
+    "/redir",
+    "/redir-abs",
+    "/loop",
+    "/chain",
+    "/noloc",
+    "/ftp",
+    "/forbidden",
+    "/err",
+    "/slow",
+    "/teapot",
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send(self, code, headers=(), message=None):
+        self.send_response(code, message)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "5")
+        self.end_headers()
+        if self.command == "GET":
+            self.wfile.write(b"hello")
+
+    def route(self):
+        port = self.server.server_address[1]
+        head = self.command == "HEAD"
+        routes = {
+            "/missing": lambda: self.send(404),
+            "/nohead": lambda: self.send(405 if head else 200),
+            "/nohead404": lambda: self.send(405 if head else 404),
+            "/notimpl": lambda: self.send(501 if head else 204),
+            "/redir": lambda: self.send(301, [("Location", "/ok?x=1")]),
+            "/redir-abs": lambda: self.send(302, [("Location", f"http://127.0.0.1:{port}/missing")]),
+            "/loop": lambda: self.send(302, [("Location", "/loop")]),
+            "/chain": lambda: self.send(307, [("Location", "/redir")]),
+            "/noloc": lambda: self.send(302),
+            "/ftp": lambda: self.send(302, [("Location", "ftp://stub.invalid/file")]),
+            "/forbidden": lambda: self.send(403),
+            "/err": lambda: self.send(500, message=""),
+        }
+        if self.path.startswith("/ok"):
+            self.send(200)
+        elif self.path == "/slow":
+            time.sleep(0.6)
+            self.send(200)
+        else:
+            routes.get(self.path, lambda: self.send(418))()
+
+    do_HEAD = route
+    do_GET = route
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_results_match_check_url(stub_server):
+    urls = [stub_server + path for path in STUB_PATHS] + ["http://127.0.0.1:1/refused", "ftp://stub.invalid/file"]
+    checker = ConcurrentLinkChecker(0.3, check_url, max_workers=4, per_host_limit=2)
+    assert checker.check_many(urls) == [check_url(url, 0.3) for url in urls]
+
+
+def test_keep_alive_checks_of_one_host(stub_server):
+    urls = [f"{stub_server}/ok{index}" for index in range(40)]
+    results = ConcurrentLinkChecker(2, check_url, max_workers=8, per_host_limit=2).check_many(urls)
+    assert results == [(200, "")] * 40
+
+
+def test_busy_host_does_not_hold_back_other_hosts():
+    started: dict[str, float] = {}
+
+    def serial_check(url, timeout_seconds):
+        started[url] = time.monotonic()
+        return 200, ""
+
+    busy = [f"http://busy.example/{index}" for index in range(8)]
+    other = ["http://other.example/a", "http://other.example/b"]
+    checker = ConcurrentLinkChecker(
+        1, serial_check, max_workers=4, per_host_limit=1, per_host_delay=0.1, serial_only=True
+    )
+    began = time.monotonic()
+    assert checker.check_many(busy + other) == [(200, "")] * 10
+
+    # The other host starts at once and again after its own delay, not after the busy host's queue.
+    assert started[other[0]] - began < 0.05
+    assert started[other[1]] - began < 0.2
+    busy_starts = sorted(started[url] for url in busy)
+    assert all(later - earlier >= 0.09 for earlier, later in zip(busy_starts, busy_starts[1:]))
+    assert busy_starts[-1] - began >= 0.65
+
+
+def test_per_host_limit_caps_concurrent_checks():
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def serial_check(url, timeout_seconds):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        return 200, ""
+
+    urls = [f"http://one.example/{index}" for index in range(12)]
+    checker = ConcurrentLinkChecker(1, serial_check, max_workers=8, per_host_limit=3, serial_only=True)
+    assert checker.check_many(urls) == [(200, "")] * 12
+    assert running["peak"] == 3
+
+
+@pytest.mark.parametrize("content", ['{"version": 1, "entries": {"http', "<<<<<<< HEAD\n{}\n", "[]", "\xff"])
+def test_unreadable_link_cache_starts_empty(tmp_path, content):
+    path = tmp_path / "link-cache.json"
+    path.write_bytes(content.encode("latin-1"))
+    now_utc = datetime.now(timezone.utc)
+    cache = LinkCheckCache(path, now_utc, ok_ttl=timedelta(days=7), error_ttl=timedelta(hours=6))
+    assert cache.entries == {}
+    assert cache.lookup("https://example.net/") is None
+
+    cache.store("https://example.net/", 200, "")
+    cache.save()
+    reloaded = LinkCheckCache(path, now_utc, ok_ttl=timedelta(days=7), error_ttl=timedelta(hours=6))
+    assert reloaded.lookup("https://example.net/") == (200, "")
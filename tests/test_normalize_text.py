@@ -0,0 +1,51 @@
+import random
+import re
+
+import pytest
+
+from partnerai_intel_report import MERGE_MARKER_PATTERN, TEMPLATE_TOKEN_PATTERN, normalize_text
+
+# Fragments that exercise template tokens, merge markers and every whitespace class \s matches.
+ALPHABET = list("{}%#<>=ab \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0    　") + [
+    "{{",
+    "}}",
+    "{%",
+    "%}",
+    "{#",
+    "#}",
+    "<<<<<<<",
+    "=======",
+    ">>>>>>>",
+    "\n=======\n",
+    " x ",
+]
+
+
+def reference_normalize_text(value):
+    """The three-pass implementation normalize_text replaced."""
+    sanitized = TEMPLATE_TOKEN_PATTERN.sub(" ", value or "")
+    sanitized = MERGE_MARKER_PATTERN.sub(" ", sanitized)
+    return re.sub(r"\s+", " ", sanitized).strip()
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_normalize_text_matches_three_pass_implementation(seed):
+    rng = random.Random(seed)
+    for _ in range(20000):
+        value = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30)))
+        assert normalize_text(value) == reference_normalize_text(value), repr(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "",
+        "  plain  text\n",
+        "Hello {{ name }} and {% if x %}{# note #}",
+        "line\n<<<<<<< HEAD\nkept\n=======\nother\n>>>>>>> branch\n",
+        "a b c\x1cd",
+    ],
+)
+def test_normalize_text_examples(value):
+    assert normalize_text(value) == reference_normalize_text(value)
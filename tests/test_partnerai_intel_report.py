@@ -0,0 +1,132 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import partnerai_intel_report as report
+
+
+def make_raw_items(count, now_utc):
+    return [
+        {
+            "title": f"Bolivia agribusiness grant program {index} opens call for proposals",
+            "description": "Funding of $500,000 is available for smallholder farmers and rural cooperatives.",
+            "source": "World Bank",
+            "url": f"https://projects.partner{index}.org/items/{index}",
+            "published_date": (now_utc - timedelta(hours=index + 1)).replace(tzinfo=None).isoformat(timespec="seconds"),
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # publish_report writes latest-report.html relative to the working directory.
+    monkeypatch.chdir(tmp_path)
+    report.reset_run_counters()
+    return tmp_path
+
+
+def parse_args(*extra):
+    return report.build_parser().parse_args(["--event-path", "event.json", "--output-dir", "reports", *extra])
+
+
+def test_rerun_with_dedupe_store_keeps_published_report(workdir):
+    args = parse_args("--dedupe-store", "dedupe.sqlite")
+    now_utc = datetime.now(timezone.utc)
+    raw_items = make_raw_items(5, now_utc)
+
+    store = report.open_dedupe_store(args, now_utc)
+    report.publish_report(args, raw_items, now_utc, store, None, None)
+    report.finish_dedupe_store(store, args.dedupe_retention_days)
+    first_manifest = json.loads((workdir / "reports" / "latest-report.manifest.json").read_text())
+    first_latest = (workdir / "latest-report.html").read_text()
+    assert first_manifest["items_published"] == 5
+
+    later = now_utc + timedelta(minutes=5)
+    store = report.open_dedupe_store(args, later)
+    report.publish_report(args, raw_items, later, store, None, None)
+    assert store.skipped == 5
+    report.finish_dedupe_store(store, args.dedupe_retention_days)
+
+    assert json.loads((workdir / "reports" / "latest-report.manifest.json").read_text()) == first_manifest
+    assert (workdir / "latest-report.html").read_text() == first_latest
+
+
+def test_unchanged_report_reports_previous_broken_links(workdir, monkeypatch):
+    checked = []
+
+    def fake_check_url(url, timeout_seconds):
+        checked.append(url)
+        return (404, "Not Found") if url.endswith("/0") else (200, "OK")
+
+    monkeypatch.setattr(report, "check_url", fake_check_url)
+    args = parse_args("--validate-links", "--link-check-workers", "1", "--fail-on-broken-links")
+    now_utc = datetime.now(timezone.utc)
+    raw_items = make_raw_items(3, now_utc)
+
+    broken = report.publish_report(args, raw_items, now_utc, None, None, None)
+    assert [row["url"] for row in broken] == ["https://projects.partner0.org/items/0"]
+    assert len(checked) == 3
+
+    report.reset_run_counters()
+    assert report.publish_report(args, raw_items, now_utc, None, None, None) == broken
+    assert len(checked) == 3
+
+
+def test_unchanged_report_without_recorded_links_is_validated(workdir, monkeypatch):
+    monkeypatch.setattr(report, "check_url", lambda url, timeout_seconds: (500, "Server Error"))
+    now_utc = datetime.now(timezone.utc)
+    raw_items = make_raw_items(2, now_utc)
+
+    report.publish_report(parse_args(), raw_items, now_utc, None, None, None)
+    report.reset_run_counters()
+    args = parse_args("--validate-links", "--link-check-workers", "1")
+    broken = report.publish_report(args, raw_items, now_utc, None, None, None)
+    assert len(broken) == 2
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_items_cut_by_max_items_are_not_recorded_as_processed(workdir, workers):
+    args = parse_args("--dedupe-store", "dedupe.sqlite", "--max-items", "2", "--workers", workers)
+    now_utc = datetime.now(timezone.utc)
+    raw_items = make_raw_items(5, now_utc)
+    published_titles = []
+
+    for run in range(3):
+        run_at = now_utc + timedelta(minutes=run)
+        store = report.open_dedupe_store(args, run_at)
+        aggregate = report.ReportAggregate(args.max_items)
+        items = report.build_report_items(raw_items, now_utc, store, workers=int(workers), aggregate=aggregate)
+        published_titles.append([item.title for item in items])
+        report.finish_dedupe_store(store, args.dedupe_retention_days)
+
+    expected = [item["title"] for item in raw_items]
+    assert published_titles == [expected[:2], expected[2:4], expected[4:]]
+
+
+def test_intel_item_table_rows_equal_the_appended_items():
+    now_utc = datetime.now(timezone.utc)
+    items = report.build_report_items(make_raw_items(20, now_utc), now_utc)
+    table = report.IntelItemTable()
+    rows = [table.append(item) for item in items]
+    assert [table[row] for row in rows] == list(items)
+    assert list(table.view(reversed(rows))) == list(reversed(items))
+    assert len(table.strings) < len(items)
+
+
+def test_compact_items_publish_the_same_report(workdir):
+    now_utc = datetime.now(timezone.utc)
+    raw_items = make_raw_items(30, now_utc)
+    raw_items[5]["description"] = "Tender: procurement of climate services. Bidders must submit an expression of interest."
+    raw_items[9]["published_date"] = raw_items[3]["published_date"]
+    published = {}
+    for compact in (False, True):
+        args = parse_args("--output-dir", f"reports-{compact}", *(["--compact-items"] if compact else []))
+        report.reset_run_counters()
+        report.publish_report(args, raw_items, now_utc, None, None, None)
+        output = workdir / f"reports-{compact}"
+        manifest = json.loads((output / "latest-report.manifest.json").read_text())
+        published[compact] = ((output / "latest.html").read_text(), manifest["fingerprint"], manifest["items_published"])
+    assert published[True] == published[False]
+    assert published[True][2] == 30
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from benchmark_startup import DEFERRED_MODULES, eagerly_loaded_modules  # noqa: E402
+
+
+def test_import_does_not_load_deferred_modules():
+    # A fresh interpreter, so modules this test process already imported do not hide an eager import.
+    assert eagerly_loaded_modules() == []
+
+
+def test_deferred_modules_are_real_module_names():
+    # A typo in the list would make the probe above pass vacuously.
+    import importlib.util
+
+    assert all(importlib.util.find_spec(name) is not None for name in DEFERRED_MODULES)